@@ -7,14 +7,17 @@ This example demonstrates:
 - Custom account management (for specific private keys)
 - Managing multiple accounts with switch_to()
 - Accessing the node reference for funding and utilities
+- Async client for overlapping independent requests
 
 Run this example: uv run python -m arkiv_starter.01_clients
 """
 
+import asyncio
 import socket
 from typing import Optional, cast
+from web3.providers.async_base import AsyncBaseProvider
 from web3.providers.base import BaseProvider
-from arkiv import Arkiv, NamedAccount
+from arkiv import Arkiv, AsyncArkiv, NamedAccount
 from arkiv.provider import ProviderBuilder
 from urllib.parse import urlparse
 
@@ -187,6 +190,34 @@ else:
     print("⚠️  No node reference (client connected to external provider)")
 
 
+print("=" * 70)
+print("PATTERN 6: Async Client (Overlapping Requests)")
+print("=" * 70)
+print("\n🚀 Using AsyncArkiv to run independent requests concurrently...")
+print("   - Same API as Arkiv, but every call is awaited")
+print("   - asyncio.gather() keeps several requests in flight at once")
+print("   - Total time is ~one round trip instead of one per request\n")
+
+
+async def read_entities_concurrently(rpc_url: str, keys: list) -> list:
+    """Fetch several entities at once over a single async client."""
+    async_provider = cast(
+        AsyncBaseProvider, ProviderBuilder().custom(url=rpc_url).async_mode().build()
+    )
+    async with AsyncArkiv(async_provider) as async_client:
+        return await asyncio.gather(*(async_client.arkiv.get_entity(key) for key in keys))
+
+
+if node:
+    entities = asyncio.run(read_entities_concurrently(node.http_url, [entity_key, entity_key3]))
+    print(f"✅ Fetched {len(entities)} entities concurrently:")
+    for fetched in entities:
+        print(f"   {fetched.key} (owner: {fetched.owner})")
+    print()
+else:
+    print("⚠️  No local node to read from\n")
+
+
 print("\n" + "=" * 70)
 print("SUMMARY: When to Use Each Pattern")
 print("=" * 70)
@@ -216,6 +247,11 @@ print("""
    ✅ Fund test accounts
    ✅ Access node utilities
    ✅ Control node lifecycle
+
+6. ASYNC CLIENT (AsyncArkiv(async_provider)):
+   ✅ Many independent reads or I/O-heavy apps
+   ✅ Overlap requests with asyncio.gather()
+   💡 Send writes from one account in order (or use a batch) to keep nonces sequential
 """)
 
 print("✅ All client initialization patterns demonstrated!\n")
@@ -8,6 +8,7 @@ This example demonstrates:
 - Extending entity expiration
 - Changing entity owner
 - Deleting entities
+- Verifying mutations from transaction receipt events
 
 Note: For client initialization patterns, see 01_clients.py
 
@@ -55,12 +56,11 @@ receipt = client.arkiv.update_entity(
 print(f"✅ Entity updated!")
 print(f"   Block: {receipt.block_number}")
 
-# Verify the update
-updated_entity = client.arkiv.get_entity(entity_key)
-assert updated_entity is not None
-if updated_entity.payload:
-    print(f"   Updated payload: {updated_entity.payload.decode('utf-8')}")
-print(f"   New expiration: {updated_entity.expires_at_block}\n")
+# Verify the update from the receipt's event - no extra read round trip needed
+update_event = receipt.updates[0]
+assert update_event.key == entity_key
+print(f"   Submitted payload: {new_data.decode('utf-8')}")
+print(f"   New expiration: {update_event.expiration_block}\n")
 
 print("⏱️  Step 4: Extending entity lifetime...")
 extend_by = client.arkiv.to_seconds(hours=1)
@@ -68,10 +68,10 @@ receipt = client.arkiv.extend_entity(entity_key, extend_by=extend_by)
 print(f"✅ Entity extended!")
 print(f"   Block: {receipt.block_number}")
 
-# Verify the extension
-extended_entity = client.arkiv.get_entity(entity_key)
-assert extended_entity is not None
-print(f"   Extended expiration: {extended_entity.expires_at_block}\n")
+# Verify the extension from the receipt's event
+extend_event = receipt.extensions[0]
+assert extend_event.key == entity_key
+print(f"   Extended expiration: {extend_event.expiration_block}\n")
 
 print("👤 Step 5: Changing entity owner...")
 # Track original signer before switching
@@ -91,10 +91,10 @@ print(f"   Block: {receipt.block_number}")
 print(f"   Old owner: {client.eth.default_account}")
 print(f"   New owner: {new_owner_account.address}\n")
 
-# Verify the ownership transfer
-transferred_entity = client.arkiv.get_entity(entity_key)
-assert transferred_entity is not None
-print(f"   Verified new owner: {transferred_entity.owner}\n")
+# Verify the ownership transfer from the receipt's event
+owner_event = receipt.change_owners[0]
+assert owner_event.key == entity_key
+print(f"   Verified new owner: {owner_event.new_owner_address}\n")
 
 print("🗑️  Step 6: Deleting entity (as new owner)...")
 # Switch to new owner to delete (only owner can delete)
@@ -107,11 +107,12 @@ receipt = client.arkiv.delete_entity(entity_key)
 print(f"✅ Entity deleted!")
 print(f"   Block: {receipt.block_number}")
 
-# Verify deletion
-if client.arkiv.entity_exists(entity_key):
-    print("   ⚠️  Entity still exists (unexpected)\n")
-else:
+# Verify deletion from the receipt's event - the transaction succeeded and the
+# event was emitted in the same block, so a follow-up read is not needed
+if any(event.key == entity_key for event in receipt.deletes):
     print("   Confirmed: Entity no longer exists\n")
+else:
+    print("   ⚠️  No delete event for entity (unexpected)\n")
 
 print("✅ CRUD operations complete!")
 
@@ -2,16 +2,37 @@
 Example 5: Querying Entities with Filters
 
 This example demonstrates:
-- Creating multiple entities
+- Creating multiple entities in a single batch transaction
 - Querying with the fluent query builder
 - Filtering with typed attributes
 - Sorting results
+- Streaming results page by page
+- Filtering on the node instead of in Python
 
 Run this example: uv run python -m arkiv_starter.05_queries
 """
 
+from typing import Iterable
+
 from arkiv import Arkiv, IntAttr, IntSort, StrAttr
-from arkiv.types import DESC, Attributes
+from arkiv.types import DESC, Attributes, Entity
+
+
+def print_results(results: Iterable[Entity]) -> None:
+    """Print entities as they stream in, then the total count.
+
+    fetch() returns a lazy iterator that loads further pages on demand, so
+    iterating it directly prints the first results as soon as the first page
+    arrives and never holds the full result set in memory.
+    """
+    count = 0
+    for entity in results:
+        count += 1
+        if entity.payload:
+            content = entity.payload.decode('utf-8')
+            print(f"   Type: {entity.content_type:20} | {content:30} | {entity.attributes}")
+    print(f"✅ Found {count} entities")
+
 
 # Setup: Start node and create client
 print("🚀 Starting local Arkiv node and client ...")
@@ -20,57 +41,68 @@ account = client.eth.default_account
 print(f"✅ Client ready with account: {account}")
 
 # Create multiple entities with different types
-print("\n📝 Creating multiple entities...")
-entities = []
+# All creates are collected in a batch and submitted as a single transaction,
+# so setup costs one round trip and one block instead of one per entity.
+print("\n📝 Creating multiple entities in a single batch transaction...")
+expires_in = client.arkiv.to_seconds(hours=1)
 entity_idx = 1
 
-# Text entities
-for i in range(3):
-    entity_key, receipt = client.arkiv.create_entity(
-        payload=f"Text document #{i + 1}".encode(),
-        content_type="text/plain",
-        attributes=Attributes({"idx": entity_idx}),
-        expires_in=client.arkiv.to_seconds(hours=1),
-    )
-    entity_idx += 1
-    entities.append(entity_key)
-    print(f"   Created text entity: {entity_key}")
-
-# JSON entities
-for i in range(2):
-    entity_key, receipt = client.arkiv.create_entity(
-        payload=f'{{"id": {i + 1}, "type": "json"}}'.encode(),
-        content_type="application/json",
-        attributes=Attributes({"idx": entity_idx}),
-        expires_in=client.arkiv.to_seconds(hours=1),
-    )
-    entity_idx += 1
-    entities.append(entity_key)
-    print(f"   Created JSON entity: {entity_key}")
+# Payloads are built from bytes templates: b"..." % args formats directly to
+# bytes, skipping the str formatting + .encode() step for each entity
+TEXT_TEMPLATE = b"Text document #%d"
+JSON_TEMPLATE = b'{"id": %d, "type": "json"}'
+
+with client.arkiv.batch() as batch:
+    # Text entities
+    for i in range(3):
+        batch.create_entity(
+            payload=TEXT_TEMPLATE % (i + 1),
+            content_type="text/plain",
+            attributes=Attributes({"idx": entity_idx, "format": "text"}),
+            expires_in=expires_in,
+        )
+        entity_idx += 1
+
+    # JSON entities
+    for i in range(2):
+        batch.create_entity(
+            payload=JSON_TEMPLATE % (i + 1),
+            content_type="application/json",
+            attributes=Attributes({"idx": entity_idx, "format": "json"}),
+            expires_in=expires_in,
+        )
+        entity_idx += 1
+
+# Batch is executed on exit; the receipt holds one create event per entity
+assert batch.receipt is not None
+entities = [event.key for event in batch.receipt.creates]
+print(f"✅ Created {len(entities)} entities in block {batch.receipt.block_number}")
+for entity_key in entities:
+    print(f"   Created entity: {entity_key}")
 
 # Query 1: Retrieve all entities with details
 # Define typed attributes
 owner = StrAttr("$owner")
 idx = IntAttr("idx")
+fmt = StrAttr("format")
 
 print(f"\n🔍 Query 1: Retrieving all entities with details...")
-all_with_details = list(client.arkiv.select().where(owner == account).fetch())
-print(f"✅ Found {len(all_with_details)} entities:")
-for entity in all_with_details:
-    if entity.payload:
-        content = entity.payload.decode('utf-8')
-        print(f"   Type: {entity.content_type:20} | {content:30} | {entity.attributes}")
+print_results(client.arkiv.select().where(owner == account).fetch())
 
 # Query 2: Retrieve entities filtered by idx and sorted by idx descending
 idx_desc = IntSort("idx", DESC)
 
 print("\n🔍 Query 2: Retrieving filtered (idx > 1 and idx < 5) and sorted (idx desc) entities")
-filtered_and_sorted = list(client.arkiv.select().where((idx > 1) & (idx < 5)).order_by(idx_desc).fetch())
-print(f"✅ Found {len(filtered_and_sorted)} entities:")
-for entity in filtered_and_sorted:
-    if entity.payload:
-        content = entity.payload.decode('utf-8')
-        print(f"   Type: {entity.content_type:20} | {content:30} | {entity.attributes}")
+print_results(client.arkiv.select().where((idx > 1) & (idx < 5)).order_by(idx_desc).fetch())
+
+# Query 3: Filter and sort by payload format on the node
+# Rather than fetching every entity and filtering/sorting in Python (which
+# scales with the total number of entities), tag entities with an attribute
+# and let the node do the work. Only matching entities cross the wire.
+print("\n🔍 Query 3: Retrieving text entities (format = text) sorted by idx desc")
+print_results(
+    client.arkiv.select().where((owner == account) & (fmt == "text")).order_by(idx_desc).fetch()
+)
 
 # Cleanup
 client.node.stop()
@@ -6,13 +6,16 @@ This example demonstrates:
 - Subscribing to entity lifecycle events (create/update/delete)
 - Real-time event monitoring with callbacks
 - Processing event data with typed event objects
+- Waiting for event delivery instead of sleeping
+- Replaying past events with a single get_logs call
 
 Run this example: uv run python -m arkiv_starter.04_events
 """
 
-import time
+import threading
 from arkiv import Arkiv, NamedAccount
 from arkiv.types import CreateEvent, UpdateEvent, DeleteEvent, ExtendEvent, ChangeOwnerEvent, TxHash
+from arkiv.utils import to_event
 
 # Setup: Start node and create client
 print("🚀 Starting local Arkiv node and client ...")
@@ -20,6 +23,24 @@ client = Arkiv()
 account = client.eth.default_account
 print(f"✅ Client ready with account: {account}\n")
 
+# Watchers deliver events from a background thread. Each callback sets a
+# threading.Event so the main flow can wait for exactly that notification
+# (returning as soon as it arrives) instead of sleeping for a fixed time.
+EVENT_TIMEOUT = 10  # seconds
+received = {
+    name: threading.Event()
+    for name in ("created", "updated", "extended", "owner_changed", "deleted")
+}
+
+
+def wait_for(name: str) -> None:
+    """Block until the watcher for `name` has delivered its event."""
+    if received[name].wait(timeout=EVENT_TIMEOUT):
+        received[name].clear()
+    else:
+        print(f"     ⚠️  No '{name}' event received within {EVENT_TIMEOUT}s\n")
+
+
 # Define event callbacks
 def on_entity_created(event: CreateEvent, tx_hash: TxHash) -> None:
     """Callback for entity creation events."""
@@ -28,6 +49,7 @@ def on_entity_created(event: CreateEvent, tx_hash: TxHash) -> None:
     print(f"     Owner: {event.owner_address}")
     print(f"     Expires at Block: {event.expiration_block}")
     print(f"     Transaction: {tx_hash}\n")
+    received["created"].set()
 
 
 def on_entity_updated(event: UpdateEvent, tx_hash: TxHash) -> None:
@@ -35,9 +57,9 @@ def on_entity_updated(event: UpdateEvent, tx_hash: TxHash) -> None:
     print("🔄 Entity Updated! - on_entity_updated(...)")
     print(f"     Entity Key: {event.key}")
     print(f"     Owner: {event.owner_address}")
-    print(f"     Old Expiration: {event.old_expiration_block}")
-    print(f"     New Expiration: {event.new_expiration_block}")
+    print(f"     Expires at Block: {event.expiration_block}")
     print(f"     Transaction: {tx_hash}\n")
+    received["updated"].set()
 
 
 def on_entity_deleted(event: DeleteEvent, tx_hash: TxHash) -> None:
@@ -46,6 +68,7 @@ def on_entity_deleted(event: DeleteEvent, tx_hash: TxHash) -> None:
     print(f"     Entity Key: {event.key}")
     print(f"     Owner: {event.owner_address}")
     print(f"     Transaction: {tx_hash}\n")
+    received["deleted"].set()
 
 
 def on_entity_extended(event: ExtendEvent, tx_hash: TxHash) -> None:
@@ -53,18 +76,18 @@ def on_entity_extended(event: ExtendEvent, tx_hash: TxHash) -> None:
     print("⏱️  Entity Extended! - on_entity_extended(...)")
     print(f"     Entity Key: {event.key}")
     print(f"     Owner: {event.owner_address}")
-    print(f"     Old Expiration: {event.old_expiration_block}")
-    print(f"     New Expiration: {event.new_expiration_block}")
+    print(f"     Expires at Block: {event.expiration_block}")
     print(f"     Transaction: {tx_hash}\n")
+    received["extended"].set()
 
 
 def on_owner_changed(event: ChangeOwnerEvent, tx_hash: TxHash) -> None:
     """Callback for owner change events."""
     print("👤 Owner Changed! - on_owner_changed(...)")
     print(f"     Entity Key: {event.key}")
-    print(f"     Old Owner: {event.old_owner_address}")
     print(f"     New Owner: {event.new_owner_address}")
     print(f"     Transaction: {tx_hash}\n")
+    received["owner_changed"].set()
 
 
 print("👂 Step 1: Setting up event watchers with Arkiv convenience methods...")
@@ -82,12 +105,14 @@ print(f"    - Owner Changed: on_owner_changed")
 print(f"    - Deleted: on_entity_deleted\n")
 
 print("📝 Step 2: Performing operations to trigger events...\n")
+start_block = client.eth.block_number  # Remember where history starts for Step 3
 
 print("1️⃣  Operation 1: Creating entity...")
 entity_key, receipt = client.arkiv.create_entity(
     payload=b"Event monitoring test", content_type="text/plain", expires_in=3600
 )
 print(f"     Created entity: {entity_key}")
+wait_for("created")
 
 print("2️⃣  Operatio 2: Updating entity...")
 receipt = client.arkiv.update_entity(
@@ -97,11 +122,13 @@ receipt = client.arkiv.update_entity(
     expires_in=7200,
 )
 print(f"     Updated entity: {entity_key}")
+wait_for("updated")
 
 print("3️⃣  Operation 3: Extending entity lifetime...")
 seconds = client.arkiv.to_seconds(hours=1)
 receipt = client.arkiv.extend_entity(entity_key, extend_by=seconds)
 print(f"     Extended entity: {entity_key}")
+wait_for("extended")
 
 print("4️⃣  Operation 4: Changing entity owner...")
 original_signer = client.current_signer  # Track original account name
@@ -110,6 +137,7 @@ new_account = NamedAccount.create(account_name)
 receipt = client.arkiv.change_owner(entity_key, new_account.address)
 print(f"     Changed owner of entity: {entity_key} to {new_account.address}")
 print(f"     Original signer: {original_signer}")
+wait_for("owner_changed")
 
 print("5️⃣  Operation 5: Deleting entity (as new owner)...")
 node = client.node
@@ -121,9 +149,25 @@ client.switch_to(account_name)  # Switch signing account to new owner
 print(f"     Current signer: {client.current_signer}")
 receipt = client.arkiv.delete_entity(entity_key)
 print(f"     Deleted entity: {entity_key}")
+wait_for("deleted")
 
 print("\n✅ All operations complete! Check the event callbacks above.\n")
 
+# All entity lifecycle events are logs of the same Arkiv contract, so the full
+# history can be fetched with ONE eth_getLogs call instead of one filter per
+# event type. The typed event class tells the operations apart.
+print("📜 Step 3: Replaying event history with a single get_logs call...")
+logs = client.eth.get_logs({
+    "address": client.arkiv.contract.address,
+    "fromBlock": start_block,
+    "toBlock": "latest",
+})
+for log in logs:
+    event = to_event(client.arkiv.contract, log)
+    if event is not None:  # Skip internal bookkeeping events
+        print(f"     Block {log['blockNumber']}: {type(event).__name__} for {event.key}")
+print()
+
 # Demonstrate cleanup
 print(f"🧹 Active filters/event watchers: {len(client.arkiv.active_filters)}")
 print("   Arkiv client automatically cleans up active filters/watchers")
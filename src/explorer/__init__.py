@@ -4,8 +4,8 @@ Usage examples:
 
   uv run -m explorer entity 0xabc123...
 
-The CLI supports connecting to a remote node via ARKIV_RPC_URL environment variable.
-If not provided, it will use a local ephemeral node with `Arkiv()`.
+By default the CLI connects to the public Arkiv network RPC. Set the
+ARKIV_RPC_URL environment variable to connect to a different node.
 """
 
 __all__ = ["main"]
@@ -3,4 +3,5 @@
 from .cli import main
 
 if __name__ == "__main__":
-    main()
+    # Propagate main()'s return code (e.g. 2 for "not found") as the exit status
+    raise SystemExit(main())
@@ -0,0 +1,227 @@
+"""Implementation of the `explorer entity` subcommand.
+
+Kept separate from `cli.py` so argument parsing does not import it; `main()`
+loads this module only when the `entity` subcommand actually runs.
+"""
+from __future__ import annotations
+
+import base64
+import json
+import logging
+import operator
+import re
+import sys
+from typing import TYPE_CHECKING, Any, Dict, List
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from arkiv import Arkiv
+
+logger = logging.getLogger(__name__)
+
+# Entity keys are 32-byte hashes; anything else cannot exist on chain
+_ENTITY_KEY_RE = re.compile(r"0x[0-9a-fA-F]{64}")
+
+# Entity fields shown by the explorer, in output order
+_ENTITY_FIELDS = operator.attrgetter(
+    "key",
+    "owner",
+    "content_type",
+    "created_at_block",
+    "last_modified_at_block",
+    "expires_at_block",
+    "attributes",
+    "payload",
+)
+
+
+_unexpected_types: set[type] = set()
+
+
+def _fallback(value: Any) -> str:
+    # Entity fields are JSON-native once key/owner are strings; log anything
+    # else (once per type) so new SDK field types are noticed, then stringify.
+    if type(value) not in _unexpected_types:
+        _unexpected_types.add(type(value))
+        logger.debug("Serializing %s value with str()", type(value).__name__)
+    return str(value)
+
+
+def _dumps(d: Any, compact: bool = False) -> bytes:
+    if orjson is not None:
+        try:
+            # No default hook: values are JSON-native, so orjson stays on its fast path
+            option = 0 if compact else orjson.OPT_INDENT_2
+            return orjson.dumps(d, option=option)
+        except TypeError:
+            # orjson rejects e.g. integers wider than 64 bits; stdlib handles them
+            pass
+    # ensure_ascii=False writes UTF-8 like orjson, so both paths print the same bytes
+    if compact:
+        return json.dumps(
+            d, separators=(",", ":"), ensure_ascii=False, default=_fallback
+        ).encode()
+    return json.dumps(d, indent=2, ensure_ascii=False, default=_fallback).encode()
+
+
+def _as_str(value: Any) -> Any:
+    """Return key/owner values as strings (hex for raw bytes)."""
+    if isinstance(value, (bytes, bytearray)):
+        return "0x" + value.hex()
+    if value is None or isinstance(value, str):
+        return value
+    return str(value)
+
+
+def _write(d: Any, compact: bool = False) -> None:
+    """Write `d` as JSON to stdout without a bytes -> str -> bytes round trip."""
+    data = _dumps(d, compact)
+    out = getattr(sys.stdout, "buffer", None)
+    if out is None:
+        # stdout replaced by a text-only stream (e.g. io.StringIO)
+        print(data.decode())
+        return
+    sys.stdout.flush()  # keep ordering with anything already printed
+    out.write(data)
+    out.write(b"\n")
+    out.flush()
+
+
+def _format_payload(payload: bytes) -> Any:
+    """Represent a payload as parsed JSON, else UTF-8 text, else base64."""
+    try:
+        # Parsed with stdlib json, which accepts bytes directly: orjson would
+        # turn integers wider than 64 bits (e.g. uint256/wei values) into floats
+        return json.loads(payload)
+    except ValueError:  # JSONDecodeError and UnicodeDecodeError are ValueErrors
+        pass
+    try:
+        return payload.decode("utf-8")
+    except UnicodeDecodeError:
+        return {"$binary_b64": base64.b64encode(payload).decode("ascii")}
+
+
+def _payload_value(payload: Any) -> Any:
+    if isinstance(payload, bytes):
+        return _format_payload(payload)
+    return payload
+
+
+def _entity_dict(entity: Any) -> Dict[str, Any]:
+    (
+        key,
+        owner,
+        content_type,
+        created_at_block,
+        last_modified_at_block,
+        expires_at_block,
+        attributes,
+        payload,
+    ) = _ENTITY_FIELDS(entity)
+
+    # Build a dict of useful fields
+    d: Dict[str, Any] = {
+        "$key": _as_str(key),
+        "$owner": _as_str(owner),
+        "$contentType": content_type,
+        "$createdAtBlock": created_at_block,
+        "$lastModifiedAtBlock": last_modified_at_block,
+        "$expiresAtBlock": expires_at_block,
+        "attributes": attributes,
+        "payload": _payload_value(payload),
+    }
+
+    return d
+
+
+def _entity_columns(entities: List[Any]) -> Dict[str, List[Any]]:
+    """Lay out several entities column-wise: one list per field.
+
+    Each field name appears once in the output rather than once per entity,
+    which keeps large listings smaller and quicker to serialize.
+    """
+    rows = [_ENTITY_FIELDS(entity) for entity in entities]
+    (
+        keys,
+        owners,
+        content_types,
+        created,
+        last_modified,
+        expires,
+        attributes,
+        payloads,
+    ) = ([row[i] for row in rows] for i in range(8))
+    return {
+        "$key": [_as_str(key) for key in keys],
+        "$owner": [_as_str(owner) for owner in owners],
+        "$contentType": content_types,
+        "$createdAtBlock": created,
+        "$lastModifiedAtBlock": last_modified,
+        "$expiresAtBlock": expires,
+        "attributes": attributes,
+        "payload": [_payload_value(payload) for payload in payloads],
+    }
+
+
+def _fetch_entities(client: Arkiv, keys: List[str]) -> Dict[str, Any]:
+    """Fetch entities for `keys`, returning them by lower-cased key.
+
+    All keys are looked up with a single `$key = a OR $key = b ...` query, so
+    N entities cost one round trip (plus paging) instead of N. If the node
+    rejects the combined query, fall back to per-key lookups so the keys it
+    can resolve are still shown. Transport errors are not retried per key.
+    """
+    from web3.exceptions import Web3RPCError
+
+    query = " OR ".join(f"$key = {key}" for key in keys)
+    try:
+        return {str(e.key).lower(): e for e in client.arkiv.query_entities(query)}
+    except (ValueError, Web3RPCError):
+        found: Dict[str, Any] = {}
+        for key in keys:
+            try:
+                found[key.lower()] = client.arkiv.get_entity(key)
+            except Exception:
+                # Treat lookup errors (parsing, rpc errors, not found) as "not found"
+                pass
+        return found
+
+
+def show_entities(client: Arkiv, keys: List[str], output: str = "json") -> int:
+    """Print one entity as a JSON object, or several as a JSON array.
+
+    `output` is "json" (indented), "json-compact" (a single line) or
+    "json-columns" (one object holding a list per field).
+    """
+    # Decide the output shape from what was asked for, before de-duplicating
+    single = len(keys) == 1
+    keys = list(dict.fromkeys(keys))  # drop duplicates, keep order
+    # Malformed keys are reported without a round trip to the node
+    valid = [key for key in keys if _ENTITY_KEY_RE.fullmatch(key)]
+    found = _fetch_entities(client, valid) if valid else {}
+
+    entities = []
+    for key in keys:
+        entity = found.get(key.lower())
+        if entity is None:
+            print(f"Entity not found: {key}", file=sys.stderr)
+        else:
+            entities.append(entity)
+    rc = 0 if len(entities) == len(keys) else 2
+
+    if output == "json-columns":
+        _write(_entity_columns(entities))
+        return rc
+
+    compact = output == "json-compact"
+    if single:
+        if entities:
+            _write(_entity_dict(entities[0]), compact)
+        return rc
+
+    _write([_entity_dict(entity) for entity in entities], compact)
+    return rc
@@ -2,79 +2,85 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import logging
-import json
 import os
 import sys
-from typing import Any, Dict, Optional, cast
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, cast
+
+if TYPE_CHECKING:  # the SDK pulls in web3; keep it off the --help path
+    from arkiv import Arkiv
 
 ARKIV_RPC_URL_DEFAULT = "https://mendoza.hoodi.arkiv.network/rpc"
 
-def _connect_client() -> Any:
-    """Return an Arkiv client. Prefer ARKIV_RPC_URL if set."""
+# Loggers raised to the --log-level so SDK and transport logs become visible
+_LOGGERS = ("arkiv", "web3", "websockets", "urllib3")
+
+
+@functools.lru_cache(maxsize=1)
+def _http_client(rpc: str) -> Arkiv:
+    """Return the Arkiv client for `rpc`, creating it on first use.
+
+    Caching the client keeps one HTTPProvider, and with it one keep-alive
+    requests session, for all lookups made in the same process.
+
+    The SDK is imported here rather than at module level so that `--help`,
+    usage errors and argument parsing never pay for importing arkiv/web3.
+    """
     try:
         from arkiv import Arkiv
         from arkiv.provider import ProviderBuilder
         from web3.providers.base import BaseProvider
-    except Exception as exc:  # pragma: no cover - environment may not have SDK in tests
+    except ImportError as exc:  # pragma: no cover - environment may not have SDK in tests
         raise RuntimeError("Arkiv SDK is required to run explorer CLI") from exc
 
-    rpc = os.getenv("ARKIV_RPC_URL", ARKIV_RPC_URL_DEFAULT)
-    if rpc:
-        provider = cast(BaseProvider, ProviderBuilder().custom(url=rpc).build())
-        return Arkiv(provider=provider)
-    # fallback: start a local Arkiv node
-    return Arkiv()
-
-
-def _format_entity(entity: Any) -> str:
-    # Build a dict of useful fields
-    d: Dict[str, Any] = {
-        "$key": entity.key,
-        "$owner": entity.owner,
-        "$contentType": entity.content_type,
-        "$createdAtBlock": getattr(entity, "created_at_block", None),
-        "$lastModifiedAtBlock": getattr(entity, "lastModifiedAtBlock", None),
-        "$expiresAtBlock": entity.expires_at_block,
-        "attributes": entity.attributes,
-    }
-
-    if entity.payload is None:
-        d["payload"] = None
-    else:
-        # Try to represent payload sensibly
-        try:
-            # If bytes -> try decode as utf-8, else base64
-            payload = entity.payload
-            if isinstance(payload, bytes):
-                text = payload.decode("utf-8")
+    provider = cast(BaseProvider, ProviderBuilder().custom(url=rpc).build())
+    return Arkiv(provider=provider)
 
-                # Try to parse as JSON
-                try:
-                    d["payload"] = json.loads(text)
-                except Exception:
-                    d["payload"] = text
-            else:
-                d["payload"] = payload
-        except Exception:
-            d["payload"] = f"<binary {len(entity.payload)} bytes>"
 
-    return json.dumps(d, indent=2, default=str)
+def _connect_client() -> Arkiv:
+    """Return an Arkiv client. Prefer ARKIV_RPC_URL if set."""
+    # An empty ARKIV_RPC_URL means "not set", like an unset variable
+    return _http_client(os.getenv("ARKIV_RPC_URL") or ARKIV_RPC_URL_DEFAULT)
 
 
-def _show_entity(client: Any, entity_key: str) -> int:
-    try:
-        entity = client.arkiv.get_entity(entity_key)
-    except Exception:
-        # Treat lookup errors (parsing, rpc errors, not found) as "not found"
-        print(f"Entity not found: {entity_key}", file=sys.stderr)
-        return 2
+def _add_entity_parser(sub: Any) -> None:
+    p_entity = sub.add_parser("entity", help="Show one or more entities by key")
+    p_entity.add_argument(
+        "keys", nargs="+", metavar="key", help="Entity key (hex string)"
+    )
+    p_entity.add_argument(
+        "--format",
+        choices=["json", "json-compact", "json-columns"],
+        default="json",
+        help="Output format: indented JSON (default), single-line JSON, "
+        "or one list per field",
+    )
 
-    print(_format_entity(entity))
-    return 0
 
+# Subcommand name -> function that registers its parser. Only the subcommand
+# named on the command line is built; all of them are built when none is given
+# (top-level help, usage errors).
+_SUBCOMMANDS: Dict[str, Callable[[Any], None]] = {
+    "entity": _add_entity_parser,
+}
 
-def main(argv: Optional[list[str]] = None) -> int:
+
+def _selected_subcommands(argv: list[str]) -> list[str]:
+    """Return the subcommand(s) whose parsers need to be built for argv."""
+    for arg in argv:
+        if arg in _SUBCOMMANDS:
+            return [arg]
+    return list(_SUBCOMMANDS)
+
+
+@functools.lru_cache(maxsize=len(_SUBCOMMANDS) + 1)
+def _build_parser(subcommands: tuple[str, ...]) -> argparse.ArgumentParser:
+    """Build the parser with the given subcommands registered.
+
+    Cached per subcommand selection so repeated `main()` calls (tests,
+    scripts) reuse it; `parse_args` does not mutate the parser.
+    """
     parser = argparse.ArgumentParser(prog="explorer")
     parser.add_argument(
         "--log-level",
@@ -84,10 +90,15 @@ def main(argv: Optional[list[str]] = None) -> int:
         help="Set the log level for Arkiv and related libraries",
     )
     sub = parser.add_subparsers(dest="cmd", required=True)
+    for name in subcommands:
+        _SUBCOMMANDS[name](sub)
+    return parser
 
-    p_entity = sub.add_parser("entity", help="Show an entity by key")
-    p_entity.add_argument("key", help="Entity key (hex string)")
 
+def main(argv: Optional[list[str]] = None) -> int:
+    if argv is None:
+        argv = sys.argv[1:]
+    parser = _build_parser(tuple(_selected_subcommands(argv)))
     args = parser.parse_args(argv)
 
     # Configure logging if requested
@@ -96,10 +107,10 @@ def main(argv: Optional[list[str]] = None) -> int:
         if level is not None:
             logging.basicConfig(level=level)
             # Set Arkiv and common libraries to the requested level so users can see SDK logs
-            logging.getLogger("arkiv").setLevel(level)
-            logging.getLogger("web3").setLevel(level)
-            logging.getLogger("websockets").setLevel(level)
-            logging.getLogger("urllib3").setLevel(level)
+            for name in _LOGGERS:
+                logger = logging.getLogger(name)
+                if logger.level != level:
+                    logger.setLevel(level)
 
     if args.cmd == "entity":
         # Try to connect and then show
@@ -109,7 +120,9 @@ def main(argv: Optional[list[str]] = None) -> int:
             print(str(exc), file=sys.stderr)
             return 3
 
-        return _show_entity(client, args.key)
+        from ._cli_entity import show_entities
+
+        return show_entities(client, args.keys, args.format)
 
     parser.print_help()
     return 1
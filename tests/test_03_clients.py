@@ -1,9 +1,11 @@
 """Tests for Example 3: Client Initialization Patterns."""
 
+import asyncio
 import pytest
-from arkiv import Arkiv, NamedAccount
+from arkiv import Arkiv, AsyncArkiv, NamedAccount
 from arkiv.provider import ProviderBuilder
 from typing import cast
+from web3.providers.async_base import AsyncBaseProvider
 from web3.providers.base import BaseProvider
 
 
@@ -169,3 +171,27 @@ def test_accounts_registry(arkiv_node):
     
     client.switch_to("account-2")
     assert client.eth.default_account == account2.address
+
+
+def test_async_client_concurrent_reads(arkiv_node, arkiv_client):
+    """Test reading multiple entities concurrently with AsyncArkiv."""
+    keys = []
+    for i in range(3):
+        entity_key, _ = arkiv_client.arkiv.create_entity(
+            payload=f"Async read {i}".encode(),
+            content_type="text/plain",
+            expires_in=3600
+        )
+        keys.append(entity_key)
+
+    async def read_all():
+        provider = cast(
+            AsyncBaseProvider,
+            ProviderBuilder().custom(url=arkiv_node.http_url).async_mode().build(),
+        )
+        async with AsyncArkiv(provider) as client:
+            return await asyncio.gather(*(client.arkiv.get_entity(key) for key in keys))
+
+    entities = asyncio.run(read_all())
+
+    assert [entity.key for entity in entities] == keys
@@ -122,3 +122,23 @@ class TestEntityCRUD:
 
         # Verify deletion
         assert not arkiv_client.arkiv.entity_exists(entity_key)
+
+    def test_receipt_events_match_entity(self, arkiv_client: Arkiv, test_payload):
+        """Test that receipt events report the same state as a fresh read."""
+        entity_key, _ = arkiv_client.arkiv.create_entity(
+            payload=test_payload,
+            content_type="text/plain",
+            expires_in=arkiv_client.arkiv.to_seconds(hours=1),
+        )
+
+        # Extend and compare the event's expiration with the stored entity
+        receipt = arkiv_client.arkiv.extend_entity(
+            entity_key, extend_by=arkiv_client.arkiv.to_seconds(hours=1)
+        )
+        extend_event = receipt.extensions[0]
+        assert extend_event.key == entity_key
+
+        entity = arkiv_client.arkiv.get_entity(entity_key)
+        assert entity.expires_at_block == extend_event.expiration_block, (
+            "Receipt event should reflect the new expiration"
+        )
@@ -126,3 +126,20 @@ class TestQuerying:
             assert entity.attributes is not None
             assert entity.attributes.get("category") == "test"
             assert entity.attributes.get("status") == "active"
+
+    def test_batch_create(self, arkiv_client: Arkiv):
+        """Test creating multiple entities in a single batch transaction."""
+        with arkiv_client.arkiv.batch() as batch:
+            for i in range(5):
+                batch.create_entity(
+                    payload=f"Batch test {i}".encode(),
+                    content_type="text/plain",
+                    attributes=cast(Attributes, {"test": "batch", "idx": i + 1}),
+                    expires_in=arkiv_client.arkiv.to_seconds(hours=1),
+                )
+
+        assert batch.receipt is not None, "Batch should be executed on exit"
+        assert len(batch.receipt.creates) == 5, "Should have one create event per entity"
+
+        results = list(arkiv_client.arkiv.query_entities('test = "batch"'))
+        assert len(results) >= 5, "Should find all batch-created entities"
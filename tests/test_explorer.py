@@ -1,7 +1,35 @@
 import json
 import re
+import subprocess
+import logging
+import sys
+from decimal import Decimal
+from types import SimpleNamespace
 
-from explorer import cli  # type: ignore[import-untyped]
+import pytest
+
+from explorer import _cli_entity, cli  # type: ignore[import-untyped]
+from explorer._cli_entity import _entity_dict  # type: ignore[import-untyped]
+
+
+def _fake_entity(key: str = "0x" + "ab" * 32, payload: bytes = b"doc", **fields):
+    """Stand-in for an SDK Entity with the fields the explorer reads."""
+    defaults = {
+        "owner": "0x0000000000000000000000000000000000000001",
+        "content_type": "text/plain",
+        "created_at_block": 1,
+        "last_modified_at_block": 2,
+        "expires_at_block": 100,
+        "attributes": {},
+    }
+    return SimpleNamespace(key=key, payload=payload, **{**defaults, **fields})
+
+
+def _stub_client(monkeypatch, entities=(), **arkiv_methods):
+    """Point the CLI at a fake client whose queries return `entities`."""
+    methods = {"query_entities": lambda query: iter(entities), **arkiv_methods}
+    client = SimpleNamespace(arkiv=SimpleNamespace(**methods))
+    monkeypatch.setattr(cli, "_connect_client", lambda: client)
 
 
 def test_entity_shows_metadata(arkiv_client, capsys, monkeypatch):
@@ -17,12 +45,13 @@ def test_entity_shows_metadata(arkiv_client, capsys, monkeypatch):
     monkeypatch.setattr(cli, "_connect_client", lambda: arkiv_client)
 
     # Run the CLI main for the entity
-    rc = cli.main(["entity", entity_key])
+    rc = cli.main(["entity", entity_key, "--format", "json-compact"])
     assert rc == 0
 
     captured = capsys.readouterr()
     out = captured.out.strip()
-    # Should be valid JSON
+    # Should be valid JSON on a single line
+    assert "\n" not in out
     data = json.loads(out)
 
     assert data["$key"] == entity_key
@@ -33,8 +62,176 @@ def test_entity_shows_metadata(arkiv_client, capsys, monkeypatch):
 def test_entity_not_found(arkiv_client, capsys, monkeypatch):
     monkeypatch.setattr(cli, "_connect_client", lambda: arkiv_client)
 
-    rc = cli.main(["entity", "0xdeadbeef"])  # nonexistent
+    rc = cli.main(["entity", "0x" + "00" * 32])  # well-formed but nonexistent
     assert rc == 2
 
     captured = capsys.readouterr()
     assert "Entity not found" in captured.err
+
+
+def test_help_does_not_import_sdk():
+    # Importing the CLI and printing help must not pull in arkiv/web3
+    code = (
+        "import sys\n"
+        "from explorer import cli\n"
+        "try:\n"
+        "    cli.main(['--help'])\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "assert 'arkiv' not in sys.modules, 'arkiv imported'\n"
+        "assert 'web3' not in sys.modules, 'web3 imported'\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+
+    assert result.returncode == 0, result.stderr
+    assert "usage: explorer" in result.stdout
+
+
+def test_module_entry_point_exit_code():
+    # `python -m explorer` must report failures through its exit status
+    result = subprocess.run(
+        [sys.executable, "-m", "explorer", "entity", "0xdeadbeef"],
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode == 2, result.stderr
+    assert "Entity not found: 0xdeadbeef" in result.stderr
+
+
+def test_entity_dict_binary_payload():
+    entity = _fake_entity(
+        payload=b"\xff\x00\x01", content_type="application/octet-stream"
+    )
+
+    data = _entity_dict(entity)
+
+    # Non-UTF-8 payloads are kept intact as base64 rather than dropped
+    assert data["payload"] == {"$binary_b64": "/wAB"}
+
+
+def test_entity_dict_keeps_wide_integers():
+    # uint256-sized values must survive payload parsing exactly, not as floats
+    entity = _fake_entity(payload=b'{"n": 123456789012345678901234567890}')
+
+    assert _entity_dict(entity)["payload"] == {"n": 123456789012345678901234567890}
+
+
+def test_entity_dict_block_metadata():
+    data = _entity_dict(_fake_entity(created_at_block=7, last_modified_at_block=9))
+
+    assert data["$createdAtBlock"] == 7
+    assert data["$lastModifiedAtBlock"] == 9
+
+
+def test_entity_multiple_keys(arkiv_client, capsys, monkeypatch):
+    keys = [
+        arkiv_client.arkiv.create_entity(
+            payload=f"doc {i}".encode(),
+            content_type="text/plain",
+            expires_in=arkiv_client.arkiv.to_seconds(days=1),
+        )[0]
+        for i in range(3)
+    ]
+
+    monkeypatch.setattr(cli, "_connect_client", lambda: arkiv_client)
+
+    rc = cli.main(["entity", *keys])
+    assert rc == 0
+
+    # Several keys print a single JSON array, in the order requested
+    data = json.loads(capsys.readouterr().out)
+    assert [d["$key"] for d in data] == keys
+    assert [d["payload"] for d in data] == ["doc 0", "doc 1", "doc 2"]
+
+
+def test_entity_malformed_key_skips_rpc(capsys, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("malformed key reached the node")
+
+    _stub_client(monkeypatch, get_entity=fail, query_entities=fail)
+
+    rc = cli.main(["entity", "0xdeadbeef"])
+    assert rc == 2
+    assert "Entity not found: 0xdeadbeef" in capsys.readouterr().err
+
+
+def test_entity_columns_format(capsys, monkeypatch):
+    entities = [
+        _fake_entity("0x" + c * 32, f"doc {i}".encode(), attributes={"n": i})
+        for i, c in enumerate(["aa", "bb"])
+    ]
+    _stub_client(monkeypatch, entities)
+
+    keys = [entity.key for entity in entities]
+    rc = cli.main(["entity", "--format", "json-columns", *keys])
+    assert rc == 0
+
+    # One list per field, entries in the order the keys were given
+    data = json.loads(capsys.readouterr().out)
+    assert data["$key"] == keys
+    assert data["$lastModifiedAtBlock"] == [2, 2]
+    assert data["attributes"] == [{"n": 0}, {"n": 1}]
+    assert data["payload"] == ["doc 0", "doc 1"]
+
+
+def test_entity_repeated_key_prints_array(capsys, monkeypatch):
+    entity = _fake_entity()
+    _stub_client(monkeypatch, [entity])
+
+    rc = cli.main(["entity", entity.key, entity.key])
+    assert rc == 0
+
+    # Passing more than one key always yields an array, even after de-duplication
+    data = json.loads(capsys.readouterr().out)
+    assert [d["$key"] for d in data] == [entity.key]
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def json_backend(request, monkeypatch):
+    """Run a test once with orjson (when installed) and once with stdlib json."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(_cli_entity, "orjson", None)
+    return request.param
+
+
+def test_dumps_wide_integer(json_backend):
+    # orjson rejects ints >= 2**64; _dumps must fall back to stdlib, not fail
+    out = _cli_entity._dumps({"attributes": {"n": 2**64}})
+
+    assert json.loads(out) == {"attributes": {"n": 2**64}}
+
+
+def test_dumps_unknown_type_uses_fallback(json_backend, monkeypatch, caplog):
+    monkeypatch.setattr(_cli_entity, "_unexpected_types", set())
+
+    with caplog.at_level(logging.DEBUG, logger=_cli_entity.__name__):
+        out = _cli_entity._dumps({"value": Decimal("1.5")}, compact=True)
+        _cli_entity._dumps({"value": Decimal("2.5")}, compact=True)
+
+    assert out == b'{"value":"1.5"}'
+    # Each unexpected type is logged once
+    assert [r.getMessage() for r in caplog.records] == [
+        "Serializing Decimal value with str()"
+    ]
+
+
+@pytest.mark.parametrize("output", ["json", "json-compact"])
+def test_output_same_with_and_without_orjson(output, capsys, monkeypatch):
+    pytest.importorskip("orjson")
+    entity = _fake_entity(
+        payload="héllo".encode(), attributes={"tags": ["a", "b"], "n": 1}
+    )
+    _stub_client(monkeypatch, [entity])
+    argv = ["entity", "--format", output, entity.key, entity.key]
+
+    assert cli.main(argv) == 0
+    with_orjson = capsys.readouterr().out
+
+    monkeypatch.setattr(_cli_entity, "orjson", None)
+    assert cli.main(argv) == 0
+    without_orjson = capsys.readouterr().out
+
+    assert with_orjson == without_orjson